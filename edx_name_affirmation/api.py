@@ -36,6 +36,8 @@ def create_verified_name(
           attempt.
         * `is_verified` (bool): Optional, defaults False. This should determine whether the
           verified_name is valid for use with ID verification, exams, etc.
+
+    Returns the created VerifiedName object.
     """
     # Do not allow empty strings
     if verified_name == '':
@@ -57,7 +59,7 @@ def create_verified_name(
         )
         raise VerifiedNameMultipleAttemptIds(err_msg)
 
-    VerifiedName.objects.create(
+    verified_name_obj = VerifiedName.objects.create(
         user=user,
         verified_name=verified_name,
         profile_name=profile_name,
@@ -77,6 +79,8 @@ def create_verified_name(
     )
     log.info(log_msg)
 
+    return verified_name_obj
+
 
 def get_verified_name(user, is_verified=False, statuses_to_exclude=None):
     """
@@ -30,7 +30,7 @@ def verified_name_approved(sender, instance, **kwargs):  # pylint: disable=unuse
     if instance.status == VerifiedNameStatus.APPROVED:
         VERIFIED_NAME_APPROVED.send(
           sender='name_affirmation',
-          user_id=instance.user.id,
+          user_id=instance.user_id,
           profile_name=instance.profile_name
         )
 
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-15 03:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('edx_name_affirmation', '0009_verifiedname_user_status_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='verifiedname',
+            index=models.Index(fields=['user', 'verified_name'], name='nameaff_vn_user_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='verifiedname',
+            index=models.Index(fields=['user', 'proctored_exam_attempt_id'], name='nameaff_vn_user_proctoring_idx'),
+        ),
+    ]
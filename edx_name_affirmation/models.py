@@ -44,6 +44,11 @@ class VerifiedName(TimeStampedModel):
         """ Meta class for this Django model """
         db_table = 'nameaffirmation_verifiedname'
         verbose_name = 'verified name'
+        indexes = [
+            models.Index(fields=['user', 'verified_name'], name='nameaff_vn_user_name_idx'),
+            models.Index(fields=['user', 'proctored_exam_attempt_id'], name='nameaff_vn_user_proctoring_idx'),
+            models.Index(fields=['user', 'status', '-created'], name='nameaff_vn_user_status_idx'),
+        ]
 
 
 class VerifiedNameConfig(ConfigurationModel):
@@ -4,4 +4,6 @@ Name Affirmation signals
 
 from django.dispatch import Signal
 
+# Sent from within the transaction that approves the VerifiedName. Receivers that start
+# asynchronous work should defer it with transaction.on_commit so it sees the approved status.
 VERIFIED_NAME_APPROVED = Signal()
@@ -1,4 +1,4 @@
-# pylint: disable=logging-format-interpolation, unused-argument
+# pylint: disable=unused-argument
 """
 Name affirmation celery tasks
 """
@@ -8,24 +8,44 @@ import logging
 from celery import shared_task
 from edx_django_utils.monitoring import set_code_owner_attribute
 
-from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.db.models import Q
+from django.db.models.signals import post_save
+from django.utils import timezone
 
 from edx_name_affirmation.models import VerifiedName
 from edx_name_affirmation.statuses import VerifiedNameStatus
 
-User = get_user_model()
-
 log = logging.getLogger(__name__)
 
 DEFAULT_RETRY_SECONDS = 30
 MAX_RETRIES = 3
 
+_APPROVED = VerifiedNameStatus.APPROVED
+
+
+def _send_post_save_signals(verified_name_ids):
+    """
+    Send post_save signals for VerifiedNames whose status was updated in bulk
+    """
+    # send signals for the most recently created VerifiedName first, as when each one was saved individually
+    verified_name_qs = VerifiedName.objects.filter(id__in=verified_name_ids).order_by('-created')
+    for verified_name_obj in verified_name_qs:
+        post_save.send(
+            sender=VerifiedName,
+            instance=verified_name_obj,
+            created=False,
+            update_fields=frozenset({'status', 'modified'}),
+            raw=False,
+            using=verified_name_obj._state.db,  # pylint: disable=protected-access
+        )
+
 
 @shared_task(
     bind=True, autoretry_for=(Exception,), default_retry_delay=DEFAULT_RETRY_SECONDS, max_retries=MAX_RETRIES,
 )
 @set_code_owner_attribute
+@transaction.atomic
 def idv_update_verified_name_task(self, attempt_id, user_id, name_affirmation_status, photo_id_name, full_name):
     """
     Celery task for updating a verified name based on an IDV attempt
@@ -44,62 +64,61 @@ def idv_update_verified_name_task(self, attempt_id, user_id, name_affirmation_st
     # some of those records may already be associated with a different IDV attempt.
     verified_names = VerifiedName.objects.filter(
         (Q(verification_attempt_id=attempt_id) | Q(verification_attempt_id__isnull=True))
-        & Q(user__id=user_id)
+        & Q(user_id=user_id)
         & Q(verified_name=photo_id_name)
-    ).order_by('-created')
-    if verified_names:
-        # if there are VerifiedName objects, we want to update existing entries
-        # for each attempt with no attempt id (either proctoring or idv), update attempt id
-        updated_for_attempt_id = verified_names.filter(
-            proctored_exam_attempt_id=None,
-            verification_attempt_id=None
-        ).update(verification_attempt_id=attempt_id)
-
-        if updated_for_attempt_id:
-            log.info(
-                'Updated VerifiedNames for user={user_id} to verification_attempt_id={attempt_id}'.format(
-                    user_id=user_id,
-                    attempt_id=attempt_id,
-                )
-            )
+    )
+    # for each attempt with no attempt id (either proctoring or idv), update attempt id
+    updated_for_attempt_id = verified_names.filter(
+        proctored_exam_attempt_id=None,
+        verification_attempt_id=None
+    ).update(verification_attempt_id=attempt_id)
 
-        # then for all matching attempt ids, update the status
-        verified_name_qs = verified_names.filter(
-            verification_attempt_id=attempt_id,
-            proctored_exam_attempt_id=None
+    if updated_for_attempt_id:
+        log.info(
+            'Updated VerifiedNames for user=%s to verification_attempt_id=%s',
+            user_id,
+            attempt_id,
         )
 
-        # Individually update to ensure that post_save signals send
-        for verified_name_obj in verified_name_qs:
-            verified_name_obj.status = name_affirmation_status
-            verified_name_obj.save()
+    # then for all matching attempt ids, update the status, skipping any that already have it
+    # so that repeated updates for the same attempt do not resend post_save signals
+    verified_name_ids = list(verified_names.filter(
+        verification_attempt_id=attempt_id,
+        proctored_exam_attempt_id=None
+    ).exclude(status=name_affirmation_status).values_list('id', flat=True))
+
+    if verified_name_ids:
+        # Update all statuses in a single query. QuerySet.update() does not send post_save signals,
+        # so send them for each updated instance within the task's transaction: if a receiver fails,
+        # the update is rolled back and the retried task sends them again.
+        VerifiedName.objects.filter(id__in=verified_name_ids).update(
+            status=name_affirmation_status, modified=timezone.now()
+        )
+        _send_post_save_signals(verified_name_ids)
 
         log.info(
-            'Updated VerifiedNames for user={user_id} with verification_attempt_id={attempt_id} to '
-            'have status={status}'.format(
-                user_id=user_id,
-                attempt_id=attempt_id,
-                status=name_affirmation_status
-            )
+            'Updated %s VerifiedName(s) for user=%s with verification_attempt_id=%s to have status=%s',
+            len(verified_name_ids),
+            user_id,
+            attempt_id,
+            name_affirmation_status,
         )
-    else:
-        # otherwise if there are no entries, we want to create one.
-        user = User.objects.get(id=user_id)
+    # if there was nothing to update, only create a VerifiedName if none matched at all. Names that
+    # already have the status, or that are linked to a proctored exam attempt, are left as they are.
+    elif not verified_names.exists():
         verified_name = VerifiedName.objects.create(
-            user=user,
+            user_id=user_id,
             verified_name=photo_id_name,
             profile_name=full_name,
             verification_attempt_id=attempt_id,
             status=name_affirmation_status,
         )
         log.error(
-            'Created VerifiedName for user={user_id} to have status={status} '
-            'and verification_attempt_id={attempt_id}, because no matching '
-            'attempt_id or verified_name were found.'.format(
-                user_id=user_id,
-                attempt_id=attempt_id,
-                status=verified_name.status
-            )
+            'Created VerifiedName for user=%s to have status=%s and verification_attempt_id=%s, '
+            'because no matching attempt_id or verified_name were found.',
+            user_id,
+            verified_name.status,
+            attempt_id,
         )
 
 
@@ -107,6 +126,7 @@ def idv_update_verified_name_task(self, attempt_id, user_id, name_affirmation_st
     bind=True, autoretry_for=(Exception,), default_retry_delay=DEFAULT_RETRY_SECONDS, max_retries=MAX_RETRIES,
 )
 @set_code_owner_attribute
+@transaction.atomic
 def proctoring_update_verified_name_task(
     self,
     attempt_id,
@@ -119,67 +139,64 @@ def proctoring_update_verified_name_task(
     Celery task for updating a verified name based on a proctoring attempt
     """
 
+    # only the id and name of the most recent approved VerifiedName are needed
     approved_verified_name = VerifiedName.objects.filter(
-        user__id=user_id,
-        status=VerifiedNameStatus.APPROVED
-    ).order_by('-created').first()
+        user_id=user_id,
+        status=_APPROVED
+    ).order_by('-created').values_list('id', 'verified_name').first()
 
     verified_name_for_exam = VerifiedName.objects.filter(
-        user__id=user_id,
+        user_id=user_id,
         proctored_exam_attempt_id=attempt_id
     ).order_by('-created').first()
 
     # check if approved VerifiedName already exists for the user, and skip
     # update if no VerifiedName has already been created for this specific exam
     if approved_verified_name and not verified_name_for_exam:
-        is_full_name_approved = approved_verified_name.verified_name == full_name
+        approved_name_id, approved_name = approved_verified_name
+        is_full_name_approved = approved_name == full_name
         if not is_full_name_approved:
             log.warning(
-                'Full name for proctored_exam_attempt_id={attempt_id} is not equal '
-                'to the most recent verified name verified_name_id={name_id}.'.format(
-                    attempt_id=attempt_id,
-                    name_id=approved_verified_name.id
-                )
+                'Full name for proctored_exam_attempt_id=%s is not equal '
+                'to the most recent verified name verified_name_id=%s.',
+                attempt_id,
+                approved_name_id,
             )
         return
 
     if verified_name_for_exam:
         verified_name_for_exam.status = name_affirmation_status
-        verified_name_for_exam.save()
+        # as in the IDV task, post_save signals are sent within the task's transaction, so a
+        # receiver failure rolls back the update and the retried task sends them again
+        verified_name_for_exam.save(update_fields=['status'])
         log.info(
-            'Updated VerifiedName for user={user_id} with proctored_exam_attempt_id={attempt_id} '
-            'to have status={status}'.format(
-                user_id=user_id,
-                attempt_id=attempt_id,
-                status=name_affirmation_status
-            )
+            'Updated VerifiedName for user=%s with proctored_exam_attempt_id=%s to have status=%s',
+            user_id,
+            attempt_id,
+            name_affirmation_status,
         )
     else:
         if full_name and profile_name:
             # if they do not already have an approved VerifiedName, create one
-            user = User.objects.get(id=user_id)
             VerifiedName.objects.create(
-                user=user,
+                user_id=user_id,
                 verified_name=full_name,
                 proctored_exam_attempt_id=attempt_id,
                 status=name_affirmation_status,
                 profile_name=profile_name
             )
             log.info(
-                'Created VerifiedName for user={user_id} to have status={status} '
-                'and proctored_exam_attempt_id={attempt_id}'.format(
-                    user_id=user_id,
-                    attempt_id=attempt_id,
-                    status=name_affirmation_status
-                )
+                'Created VerifiedName for user=%s to have status=%s and proctored_exam_attempt_id=%s',
+                user_id,
+                name_affirmation_status,
+                attempt_id,
             )
         else:
             log.error(
-                'Cannot create VerifiedName for user={user_id} for proctored_exam_attempt_id={attempt_id} '
-                'because neither profile name nor full name were provided'.format(
-                    user_id=user_id,
-                    attempt_id=attempt_id,
-                )
+                'Cannot create VerifiedName for user=%s for proctored_exam_attempt_id=%s '
+                'because neither profile name nor full name were provided',
+                user_id,
+                attempt_id,
             )
 
 
@@ -211,12 +228,10 @@ def delete_verified_name_task(self, idv_attempt_id, proctoring_attempt_id):
 
     if verified_names:
         log.info(
-            'Deleting {num_names} VerifiedName(s) associated with {field_name}='
-            '{verification_attempt_id}'.format(
-                num_names=len(verified_names),
-                field_name=log_message['field_name'],
-                verification_attempt_id=log_message['attempt_id'],
-            )
+            'Deleting %s VerifiedName(s) associated with %s=%s',
+            len(verified_names),
+            log_message['field_name'],
+            log_message['attempt_id'],
         )
         verified_names.delete()
 
@@ -3,6 +3,7 @@ Tests for the `edx_name_affirmation` Python API.
 """
 
 import ddt
+from edx_django_utils.cache import RequestCache
 
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
@@ -39,15 +40,20 @@ class TestVerifiedNameAPI(TestCase):
     VERIFICATION_ATTEMPT_ID = 123
     PROCTORED_EXAM_ATTEMPT_ID = 456
 
-    def setUp(self):
-        super().setUp()
-        self.user = User(username='jondoe', email='jondoe@test.com')
-        self.user.save()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user = User.objects.create(username='jondoe', email='jondoe@test.com')
         # Create a fresh config with default values
-        VerifiedNameConfig.objects.create(user=self.user)
+        VerifiedNameConfig.objects.create(user=cls.user)
+        # Additional user used to make sure that config values are cached per user
+        cls.other_user = User.objects.create(username='bobsmith', email='bobsmith@test.com')
 
     def tearDown(self):
         super().tearDown()
+        # config lookups are cached per user in both the request cache and the django cache,
+        # so clear both between tests
+        RequestCache.clear_all_namespaces()
         cache.clear()
 
     def test_create_verified_name_defaults(self):
@@ -61,24 +67,27 @@ class TestVerifiedNameAPI(TestCase):
         self.assertIsNone(verified_name_obj.proctored_exam_attempt_id)
         self.assertEqual(verified_name_obj.status, VerifiedNameStatus.PENDING.value)
 
-    @ddt.data(
-        (123, None, VerifiedNameStatus.APPROVED),
-        (None, 456, VerifiedNameStatus.SUBMITTED),
-    )
-    @ddt.unpack
-    def test_create_verified_name_with_optional_arguments(
-        self, verification_attempt_id, proctored_exam_attempt_id, status,
-    ):
+    def test_create_verified_name_with_optional_arguments(self):
         """
         Test to create a verified name with optional arguments supplied.
         """
-        verified_name_obj = self._create_verified_name(
-            verification_attempt_id, proctored_exam_attempt_id, status,
-        )
-
-        self.assertEqual(verified_name_obj.verification_attempt_id, verification_attempt_id)
-        self.assertEqual(verified_name_obj.proctored_exam_attempt_id, proctored_exam_attempt_id)
-        self.assertEqual(verified_name_obj.status, status.value)
+        optional_arguments = [
+            (123, None, VerifiedNameStatus.APPROVED),
+            (None, 456, VerifiedNameStatus.SUBMITTED),
+        ]
+        for verification_attempt_id, proctored_exam_attempt_id, status in optional_arguments:
+            with self.subTest(
+                verification_attempt_id=verification_attempt_id,
+                proctored_exam_attempt_id=proctored_exam_attempt_id,
+                status=status,
+            ):
+                verified_name_obj = self._create_verified_name(
+                    verification_attempt_id, proctored_exam_attempt_id, status,
+                )
+
+                self.assertEqual(verified_name_obj.verification_attempt_id, verification_attempt_id)
+                self.assertEqual(verified_name_obj.proctored_exam_attempt_id, proctored_exam_attempt_id)
+                self.assertEqual(verified_name_obj.status, status.value)
 
     def test_create_verified_name_two_ids(self):
         """
@@ -211,8 +220,9 @@ class TestVerifiedNameAPI(TestCase):
 
         update_verification_attempt_id(self.user, self.VERIFICATION_ATTEMPT_ID)
 
-        first_verified_name_obj = VerifiedName.objects.get(id=first_verified_name_id)
-        second_verified_name_obj = VerifiedName.objects.get(id=second_verified_name_id)
+        verified_name_objs = VerifiedName.objects.in_bulk([first_verified_name_id, second_verified_name_id])
+        first_verified_name_obj = verified_name_objs[first_verified_name_id]
+        second_verified_name_obj = verified_name_objs[second_verified_name_id]
 
         self.assertIsNone(first_verified_name_obj.verification_attempt_id)
         self.assertEqual(second_verified_name_obj.verification_attempt_id, self.VERIFICATION_ATTEMPT_ID)
@@ -296,11 +306,10 @@ class TestVerifiedNameAPI(TestCase):
         """
         Util to create and return a VerifiedName with default names.
         """
-        create_verified_name(
+        return create_verified_name(
             self.user, self.VERIFIED_NAME, self.PROFILE_NAME, verification_attempt_id,
             proctored_exam_attempt_id, status
         )
-        return get_verified_name(self.user)
 
     @ddt.data(
         (True, True),
@@ -317,9 +326,7 @@ class TestVerifiedNameAPI(TestCase):
 
         # create config for other user, make sure it is the opposite of the expected value.
         # we want to add an additional config to make sure that caching by user works properly
-        other_user = User(username='bobsmith', email='bobsmith@test.com')
-        other_user.save()
-        VerifiedNameConfig.objects.create(user=other_user, use_verified_name_for_certs=not expected_value)
+        VerifiedNameConfig.objects.create(user=self.other_user, use_verified_name_for_certs=not expected_value)
 
         should_use_for_certs = should_use_verified_name_for_certs(self.user)
         self.assertEqual(should_use_for_certs, expected_value)
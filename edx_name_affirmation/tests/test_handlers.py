@@ -2,11 +2,14 @@
 Tests for Name Affirmation signal handlers
 """
 
+from datetime import timedelta
+
 import ddt
-from mock import MagicMock, patch
+from mock import MagicMock, call, patch
 
 from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
 
 from edx_name_affirmation.handlers import (
     idv_attempt_handler,
@@ -26,8 +29,7 @@ class SignalTestCase(TestCase):
     """
 
     def setUp(self):
-        self.user = User(username='tester', email='tester@test.com')
-        self.user.save()
+        self.user = User.objects.create(username='tester', email='tester@test.com')
         self.verified_name = 'Jonathan Smith'
         self.profile_name = 'Jon Smith'
         self.idv_attempt_id = 1111111
@@ -134,6 +136,86 @@ class IDVSignalTests(SignalTestCase):
         self.assertEqual(len(VerifiedName.objects.filter(verification_attempt_id=self.idv_attempt_id)), 3)
         self.assertEqual(len(VerifiedName.objects.filter(status=expected_status)), 3)
 
+    def test_idv_update_signals_newest_first(self):
+        """
+        Test that signals for VerifiedNames updated by an IDV attempt are sent from the most recently created
+        """
+        now = timezone.now()
+        for days_ago, profile_name in ((2, 'oldest'), (1, 'middle'), (0, 'newest')):
+            VerifiedName.objects.create(
+                user=self.user,
+                verified_name=self.verified_name,
+                profile_name=profile_name,
+                created=now - timedelta(days=days_ago),
+            )
+
+        with patch('edx_name_affirmation.signals.VERIFIED_NAME_APPROVED.send') as mock_signal:
+            idv_attempt_handler(
+                self.idv_attempt_id,
+                self.user.id,
+                'approved',
+                self.verified_name,
+                self.profile_name
+            )
+
+        self.assertEqual(mock_signal.call_args_list, [
+            call(sender='name_affirmation', user_id=self.user.id, profile_name=profile_name)
+            for profile_name in ('newest', 'middle', 'oldest')
+        ])
+
+    def test_idv_update_records_history(self):
+        """
+        Test that updating VerifiedName statuses for an IDV attempt still records history for each updated entry
+        """
+        verified_name_obj = VerifiedName.objects.create(
+            user=self.user,
+            verified_name=self.verified_name,
+            profile_name=self.profile_name,
+            verification_attempt_id=self.idv_attempt_id
+        )
+
+        idv_attempt_handler(
+            self.idv_attempt_id,
+            self.user.id,
+            'submitted',
+            self.verified_name,
+            self.profile_name
+        )
+
+        latest_history = verified_name_obj.history.latest()
+        self.assertEqual(verified_name_obj.history.count(), 2)
+        self.assertEqual(latest_history.status, VerifiedNameStatus.SUBMITTED)
+
+    def test_idv_repeated_update_does_not_resend_signals(self):
+        """
+        Test that an IDV update for a VerifiedName that already has the new status does not save it again
+        """
+        verified_name_obj = VerifiedName.objects.create(
+            user=self.user,
+            verified_name=self.verified_name,
+            profile_name=self.profile_name,
+            verification_attempt_id=self.idv_attempt_id,
+            status=VerifiedNameStatus.APPROVED
+        )
+
+        with patch('edx_name_affirmation.signals.VERIFIED_NAME_APPROVED.send') as mock_signal:
+            with patch('edx_name_affirmation.tasks.log') as mock_log:
+                idv_attempt_handler(
+                    self.idv_attempt_id,
+                    self.user.id,
+                    'approved',
+                    self.verified_name,
+                    self.profile_name
+                )
+
+            mock_signal.assert_not_called()
+
+        # no status update is logged, since no VerifiedNames were updated
+        logged_messages = [info_call.args[0] for info_call in mock_log.info.call_args_list]
+        self.assertFalse(any(message.startswith('Updated %s VerifiedName(s)') for message in logged_messages))
+        self.assertEqual(len(VerifiedName.objects.filter()), 1)
+        self.assertEqual(verified_name_obj.history.count(), 1)
+
     def test_idv_create_with_existing_verified_names(self):
         """
         Test that if a user attempts IDV again with the same name as previous attempts, we still create a new record
@@ -194,6 +276,30 @@ class IDVSignalTests(SignalTestCase):
         self.assertEqual(len(VerifiedName.objects.filter(verification_attempt_id=self.idv_attempt_id)), 1)
         self.assertEqual(len(VerifiedName.objects.filter(status=VerifiedNameStatus.SUBMITTED)), 1)
 
+    def test_idv_does_not_create_verified_name_if_only_proctoring_match(self):
+        """
+        If the only VerifiedName matching the photo id name is linked to a proctoring attempt, ensure that
+        the idv handler neither updates it nor creates a new record
+        """
+        VerifiedName.objects.create(
+            user=self.user,
+            verified_name=self.verified_name,
+            profile_name=self.profile_name,
+            proctored_exam_attempt_id=self.proctoring_attempt_id,
+            status=VerifiedNameStatus.DENIED
+        )
+
+        idv_attempt_handler(
+            self.idv_attempt_id,
+            self.user.id,
+            'submitted',
+            self.verified_name,
+            self.profile_name
+        )
+
+        self.assertEqual(len(VerifiedName.objects.filter()), 1)
+        self.assertEqual(len(VerifiedName.objects.filter(status=VerifiedNameStatus.DENIED)), 1)
+
     @ddt.data(
         ('created', VerifiedNameStatus.PENDING),
         ('submitted', VerifiedNameStatus.SUBMITTED),
@@ -447,20 +553,17 @@ class ProctoringSignalTests(SignalTestCase):
         )
 
         log_str = (
-            'Full name for proctored_exam_attempt_id={attempt_id} is not equal to the most recent verified '
-            'name verified_name_id={verified_name_id}.'
-        ).format(
-            attempt_id=additional_attempt_id,
-            verified_name_id=verified_name.id
+            'Full name for proctored_exam_attempt_id=%s is not equal to the most recent verified '
+            'name verified_name_id=%s.'
         )
 
         self.assertEqual(len(VerifiedName.objects.filter()), 1)
         if should_names_differ:
-            mock_logger.assert_called_with(log_str)
+            mock_logger.assert_called_with(log_str, additional_attempt_id, verified_name.id)
         else:
             # check that log is not called if the names do not differ
             with self.assertRaises(AssertionError):
-                mock_logger.assert_called_with(log_str)
+                mock_logger.assert_called_with(log_str, additional_attempt_id, verified_name.id)
 
     @ddt.data(
         'download_software_clicked',
@@ -6,9 +6,11 @@ import ddt
 from mock import patch
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.db import IntegrityError
+from django.test import TestCase, TransactionTestCase
 
 from edx_name_affirmation.models import VerifiedName
+from edx_name_affirmation.signals import VERIFIED_NAME_APPROVED
 from edx_name_affirmation.statuses import VerifiedNameStatus
 from edx_name_affirmation.tasks import (
     delete_verified_name_task,
@@ -25,8 +27,7 @@ class TaskTests(TestCase):
     Tests for tasks.py
     """
     def setUp(self):
-        self.user = User(username='tester', email='tester@test.com')
-        self.user.save()
+        self.user = User.objects.create(username='tester', email='tester@test.com')
         self.verified_name_obj = VerifiedName(
           user=self.user, verified_name='Jonathan Doe', profile_name='Jon Doe',
         )
@@ -35,27 +36,36 @@ class TaskTests(TestCase):
         self.proctoring_attempt_id = 2222222
 
     @patch('edx_name_affirmation.tasks.idv_update_verified_name_task.retry')
-    def test_idv_retry(self, mock_retry):
+    @patch('edx_name_affirmation.tasks.VerifiedName.objects.create', side_effect=IntegrityError)
+    def test_idv_retry(self, mock_create, mock_retry):
+        """
+        Assert that the task is retried if a database error occurs while creating a VerifiedName
+        """
         idv_update_verified_name_task.delay(
             self.idv_attempt_id,
-            # force an error with an invalid user ID
-            99999,
+            self.user.id,
             VerifiedNameStatus.SUBMITTED,
-            self.verified_name_obj.verified_name,
+            # use a name that does not match any existing VerifiedName, so that one is created
+            'Jonathan X Doe',
             self.verified_name_obj.profile_name,
         )
+        mock_create.assert_called()
         mock_retry.assert_called()
 
     @patch('edx_name_affirmation.tasks.proctoring_update_verified_name_task.retry')
-    def test_proctoring_retry(self, mock_retry):
+    @patch('edx_name_affirmation.tasks.VerifiedName.objects.create', side_effect=IntegrityError)
+    def test_proctoring_retry(self, mock_create, mock_retry):
+        """
+        Assert that the task is retried if a database error occurs while creating a VerifiedName
+        """
         proctoring_update_verified_name_task.delay(
             self.proctoring_attempt_id,
-            # force an error with an invalid user ID
-            99999,
+            self.user.id,
             VerifiedNameStatus.PENDING,
             self.verified_name_obj.verified_name,
             self.verified_name_obj.profile_name,
         )
+        mock_create.assert_called()
         mock_retry.assert_called()
 
     def test_idv_delete(self):
@@ -155,3 +165,45 @@ class TaskTests(TestCase):
         mock_logger.assert_called_with(
             'No VerifiedNames deleted because no VerifiedNames were associated with the provided attempt ID.'
         )
+
+
+class TaskRetryTransactionTests(TransactionTestCase):
+    """
+    Tests for task retries that depend on the task's transaction being committed
+    """
+    def setUp(self):
+        self.user = User.objects.create(username='tester', email='tester@test.com')
+        self.idv_attempt_id = 1111111
+        self.verified_name_obj = VerifiedName.objects.create(
+            user=self.user,
+            verified_name='Jonathan Doe',
+            profile_name='Jon Doe',
+            verification_attempt_id=self.idv_attempt_id,
+        )
+        self.approved_receiver_calls = []
+        VERIFIED_NAME_APPROVED.connect(self._flaky_approved_receiver)
+        self.addCleanup(VERIFIED_NAME_APPROVED.disconnect, self._flaky_approved_receiver)
+
+    def _flaky_approved_receiver(self, sender, **kwargs):  # pylint: disable=unused-argument
+        """
+        VERIFIED_NAME_APPROVED receiver that fails the first time it is called
+        """
+        self.approved_receiver_calls.append(kwargs)
+        if len(self.approved_receiver_calls) == 1:
+            raise Exception('Receiver failed')  # pylint: disable=broad-exception-raised
+
+    def test_idv_approval_resent_after_receiver_failure(self):
+        """
+        Assert that if a VERIFIED_NAME_APPROVED receiver fails, the retried task sends the signal again
+        """
+        idv_update_verified_name_task.delay(
+            self.idv_attempt_id,
+            self.user.id,
+            VerifiedNameStatus.APPROVED,
+            self.verified_name_obj.verified_name,
+            self.verified_name_obj.profile_name,
+        )
+
+        self.assertEqual(len(self.approved_receiver_calls), 2)
+        self.verified_name_obj.refresh_from_db()
+        self.assertEqual(self.verified_name_obj.status, VerifiedNameStatus.APPROVED)
@@ -32,8 +32,7 @@ class NameAffirmationViewsTestCase(LoggedInTestCase):
 
     def setUp(self):
         super().setUp()
-        self.other_user = User(username='other_tester', email='other@test.com')
-        self.other_user.save()
+        self.other_user = User.objects.create(username='other_tester', email='other@test.com')
         # Create fresh configs with default values
         VerifiedNameConfig.objects.create(user=self.user)
         VerifiedNameConfig.objects.create(user=self.other_user)
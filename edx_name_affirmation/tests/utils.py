@@ -58,6 +58,5 @@ class LoggedInTestCase(TestCase):
         """
         super().setUp()
         self.client = TestClient()
-        self.user = User(username='tester', email='tester@test.com')
-        self.user.save()
+        self.user = User.objects.create(username='tester', email='tester@test.com')
         self.client.login_user(self.user)